@@ -48,7 +48,7 @@ class AuthRequiredMiddleware(object):
         if token := get_token_from_request(request):
             # Does the provided token match a valid user?
             try:
-                token = ApiToken.objects.get(key=token)
+                token = ApiToken.objects.select_related('user').get(key=token)
 
                 if token.active and token.user:
                     # Provide the user information to the request
@@ -6,32 +6,40 @@ from django.db import migrations, models
 import django.db.models.deletion
 
 
+# PurchaseOrder status choices at the time of this migration
+_PO_STATUS_CHOICES = [(10, 'Pending'), (20, 'Placed'), (30, 'Complete'), (40, 'Cancelled'), (50, 'Lost'), (60, 'Returned')]
+
+
 class Migration(migrations.Migration):
 
+    atomic = False
+
     dependencies = [
         ('stock', '0031_auto_20200422_0209'),
         ('order', '0027_auto_20200422_0236'),
     ]
 
     operations = [
-        migrations.AlterField(
-            model_name='purchaseorder',
-            name='status',
-            field=models.PositiveIntegerField(choices=[(10, 'Pending'), (20, 'Placed'), (30, 'Complete'), (40, 'Cancelled'), (50, 'Lost'), (60, 'Returned')], default=10, help_text='Purchase order status'),
-        ),
-        migrations.AlterField(
-            model_name='salesorder',
-            name='status',
-            field=models.PositiveIntegerField(choices=[(10, 'Pending'), (20, 'Shipped'), (40, 'Cancelled'), (50, 'Lost'), (60, 'Returned')], default=10, help_text='Purchase order status'),
-        ),
-        migrations.AlterField(
-            model_name='salesorderallocation',
-            name='item',
-            field=models.ForeignKey(help_text='Select stock item to allocate', limit_choices_to={'part__salable': True}, on_delete=django.db.models.deletion.CASCADE, related_name='sales_order_allocations', to='stock.StockItem'),
-        ),
-        migrations.AlterField(
-            model_name='salesorderallocation',
-            name='quantity',
-            field=InvenTree.fields.RoundingDecimalField(decimal_places=5, default=1, help_text='Enter stock allocation quantity', max_digits=15, validators=[django.core.validators.MinValueValidator(0)]),
+        # These operations only change 'choices' / 'help_text',
+        # which are not reflected in the database schema
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='purchaseorder',
+                    name='status',
+                    field=models.PositiveIntegerField(choices=_PO_STATUS_CHOICES, default=10, help_text='Purchase order status'),
+                ),
+                migrations.AlterField(
+                    model_name='salesorderallocation',
+                    name='item',
+                    field=models.ForeignKey(help_text='Select stock item to allocate', limit_choices_to={'part__salable': True}, on_delete=django.db.models.deletion.CASCADE, related_name='sales_order_allocations', to='stock.StockItem'),
+                ),
+                migrations.AlterField(
+                    model_name='salesorderallocation',
+                    name='quantity',
+                    field=InvenTree.fields.RoundingDecimalField(decimal_places=5, default=1, help_text='Enter stock allocation quantity', max_digits=15, validators=[django.core.validators.MinValueValidator(0)]),
+                ),
+            ],
+            database_operations=[],
         ),
     ]
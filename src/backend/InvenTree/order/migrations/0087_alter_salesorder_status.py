@@ -3,16 +3,28 @@
 from django.db import migrations, models
 
 
+# SalesOrder status choices at the time of this migration
+_SO_STATUS_CHOICES = [(10, 'Pending'), (15, 'In Progress'), (20, 'Shipped'), (40, 'Cancelled'), (50, 'Lost'), (60, 'Returned')]
+
+
 class Migration(migrations.Migration):
 
+    atomic = False
+
     dependencies = [
         ('order', '0086_auto_20230323_1108'),
     ]
 
     operations = [
-        migrations.AlterField(
-            model_name='salesorder',
-            name='status',
-            field=models.PositiveIntegerField(choices=[(10, 'Pending'), (15, 'In Progress'), (20, 'Shipped'), (40, 'Cancelled'), (50, 'Lost'), (60, 'Returned')], default=10, help_text='Purchase order status', verbose_name='Status'),
+        # Only the field choices change; no database changes are required
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='salesorder',
+                    name='status',
+                    field=models.PositiveIntegerField(choices=_SO_STATUS_CHOICES, default=10, help_text='Purchase order status', verbose_name='Status'),
+                ),
+            ],
+            database_operations=[],
         ),
     ]
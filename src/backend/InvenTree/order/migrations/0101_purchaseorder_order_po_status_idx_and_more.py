@@ -0,0 +1,21 @@
+# Generated by Django 4.2.12 on 2026-10-15 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0100_remove_returnorderattachment_order_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='purchaseorder',
+            index=models.Index(fields=['status', 'id'], name='order_po_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='salesorder',
+            index=models.Index(fields=['status', 'id'], name='order_so_status_idx'),
+        ),
+    ]
@@ -378,6 +378,7 @@ class PurchaseOrder(TotalPriceMixin, Order):
         """Model meta options."""
 
         verbose_name = _('Purchase Order')
+        indexes = [models.Index(fields=['status', 'id'], name='order_po_status_idx')]
 
     def report_context(self):
         """Return report context data for this PurchaseOrder."""
@@ -843,6 +844,7 @@ class SalesOrder(TotalPriceMixin, Order):
         """Model meta options."""
 
         verbose_name = _('Sales Order')
+        indexes = [models.Index(fields=['status', 'id'], name='order_so_status_idx')]
 
     def report_context(self):
         """Generate report context data for this SalesOrder."""
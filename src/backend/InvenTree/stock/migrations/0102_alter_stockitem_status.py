@@ -2,19 +2,30 @@
 
 import django.core.validators
 from django.db import migrations, models
-import stock.status_codes
+
+
+# StockItem status choices at the time of this migration
+_STOCK_STATUS_CHOICES = [(10, 'OK'), (50, 'Attention needed'), (55, 'Damaged'), (60, 'Destroyed'), (65, 'Rejected'), (70, 'Lost'), (75, 'Quarantined'), (85, 'Returned')]
 
 
 class Migration(migrations.Migration):
 
+    atomic = False
+
     dependencies = [
         ('stock', '0101_stockitemtestresult_metadata'),
     ]
 
     operations = [
-        migrations.AlterField(
-            model_name='stockitem',
-            name='status',
-            field=models.PositiveIntegerField(choices=stock.status_codes.StockStatus.items(), default=10, validators=[django.core.validators.MinValueValidator(0)]),
+        # Only the field choices change; no database changes are required
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='stockitem',
+                    name='status',
+                    field=models.PositiveIntegerField(choices=_STOCK_STATUS_CHOICES, default=10, validators=[django.core.validators.MinValueValidator(0)]),
+                ),
+            ],
+            database_operations=[],
         ),
     ]
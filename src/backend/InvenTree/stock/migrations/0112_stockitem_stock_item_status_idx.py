@@ -0,0 +1,17 @@
+# Generated by Django 4.2.12 on 2026-10-15 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock', '0111_delete_stockitemattachment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stockitem',
+            index=models.Index(fields=['status', 'id'], name='stock_item_status_idx'),
+        ),
+    ]
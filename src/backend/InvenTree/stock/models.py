@@ -356,6 +356,7 @@ class StockItem(
         """Model meta options."""
 
         verbose_name = _('Stock Item')
+        indexes = [models.Index(fields=['status', 'id'], name='stock_item_status_idx')]
 
     @staticmethod
     def get_api_url():
@@ -45,7 +45,9 @@ class OwnerList(ListAPI):
     Cannot create.
     """
 
-    queryset = Owner.objects.all()
+    # Resolve the owner type and the generic "owner" relation up front,
+    # rather than with a separate query for each listed owner
+    queryset = Owner.objects.select_related('owner_type').prefetch_related('owner')
     serializer_class = OwnerSerializer
 
     def filter_queryset(self, queryset):
@@ -108,7 +110,7 @@ class OwnerDetail(RetrieveAPI):
     Cannot edit or delete
     """
 
-    queryset = Owner.objects.all()
+    queryset = Owner.objects.select_related('owner_type')
     serializer_class = OwnerSerializer
 
 
@@ -61,13 +61,19 @@ class UsersConfig(AppConfig):
         """Create an 'owner' object for each user and group instance."""
         from django.contrib.auth import get_user_model
         from django.contrib.auth.models import Group
+        from django.contrib.contenttypes.models import ContentType
 
         from users.models import Owner
 
-        # Create group owners
-        for group in Group.objects.all():
-            Owner.create(group)
-
-        # Create user owners
-        for user in get_user_model().objects.all():
-            Owner.create(user)
+        # Create missing group and user owners
+        for model in [Group, get_user_model()]:
+            # Note: NULL values must be excluded, otherwise NOT IN matches nothing
+            existing = (
+                Owner.objects.filter(
+                    owner_type=ContentType.objects.get_for_model(model)
+                )
+                .exclude(owner_id=None)
+                .values_list('owner_id', flat=True)
+            )
+
+            Owner.bulk_create_for(model.objects.exclude(pk__in=existing).only('pk'))
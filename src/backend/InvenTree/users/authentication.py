@@ -1,6 +1,7 @@
 """Custom token authentication class for InvenTree API."""
 
 import datetime
+from types import SimpleNamespace
 
 from django.utils.translation import gettext_lazy as _
 
@@ -16,10 +17,25 @@ class ApiTokenAuthentication(TokenAuthentication):
     Changes:
     - Tokens can be revoked
     - Tokens can expire
+    - Only the token fields required for authentication are loaded
     """
 
     model = ApiToken
 
+    # Token fields which are required to authenticate a request
+    token_fields = ['key', 'user', 'revoked', 'expiry', 'last_seen']
+
+    def get_model(self):
+        """Return the token 'model' used by the default authentication lookup.
+
+        The lookup (and error messages) provided by DRF are retained,
+        but only the token fields required for authentication are loaded.
+        """
+        return SimpleNamespace(
+            objects=self.model.objects.only(*self.token_fields),
+            DoesNotExist=self.model.DoesNotExist,
+        )
+
     def authenticate_credentials(self, key):
         """Adds additional checks to the default token authentication method."""
         # If this runs without error, then the token is valid (so far)
@@ -33,7 +49,8 @@ class ApiTokenAuthentication(TokenAuthentication):
 
         if token.last_seen != datetime.date.today():
             # Update the last-seen date
+            # Note: A direct update avoids loading (and validating) the deferred fields
             token.last_seen = datetime.date.today()
-            token.save()
+            self.model.objects.filter(pk=token.pk).update(last_seen=token.last_seen)
 
         return (user, token)
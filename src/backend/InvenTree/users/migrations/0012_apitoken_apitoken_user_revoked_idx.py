@@ -0,0 +1,17 @@
+# Generated by Django 4.2.12 on 2026-10-15 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_auto_20240523_1640'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='apitoken',
+            index=models.Index(fields=['user', 'revoked'], name='apitoken_user_revoked_idx'),
+        ),
+    ]
@@ -1,7 +1,9 @@
 """Database model definitions for the 'users' app."""
 
 import datetime
+import functools
 import logging
+from types import MappingProxyType
 
 from django.conf import settings
 from django.contrib import admin
@@ -12,7 +14,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.validators import MinLengthValidator
 from django.db import models
-from django.db.models import Q, UniqueConstraint
+from django.db.models import Exists, OuterRef, Q, UniqueConstraint
 from django.db.models.signals import post_delete, post_save
 from django.db.utils import IntegrityError
 from django.dispatch import receiver
@@ -34,9 +36,11 @@ logger = logging.getLogger('inventree')
 # string representation of a user
 def user_model_str(self):
     """Function to override the default Django User __str__."""
-    if get_global_setting('DISPLAY_FULL_NAMES', cache=True):
-        if self.first_name or self.last_name:
-            return f'{self.first_name} {self.last_name}'
+    # Only look up the setting if there is a name to display
+    if (self.first_name or self.last_name) and get_global_setting(
+        'DISPLAY_FULL_NAMES', cache=True
+    ):
+        return f'{self.first_name} {self.last_name}'
     return self.username
 
 
@@ -44,6 +48,10 @@ User.add_to_class('__str__', user_model_str)  # Overriding User.__str__
 #  OVERRIDE END
 
 
+# Default lifetime of a newly created token
+TOKEN_EXPIRY_DELTA = datetime.timedelta(days=365)
+
+
 def default_token():
     """Generate a default value for the token."""
     return ApiToken.generate_key()
@@ -53,18 +61,25 @@ def default_token_expiry():
     """Generate an expiry date for a newly created token."""
     # TODO: Custom value for default expiry timeout
     # TODO: For now, tokens last for 1 year
-    return InvenTree.helpers.current_date() + datetime.timedelta(days=365)
+    return InvenTree.helpers.current_date() + TOKEN_EXPIRY_DELTA
+
+
+@functools.lru_cache(maxsize=1)
+def token_key_suffix(date: datetime.date) -> str:
+    """Return the token key suffix for the provided creation date."""
+    return '-' + date.strftime('%Y%m%d')
 
 
 def default_create_token(token_model, user, serializer):
     """Generate a default value for the token."""
-    token = token_model.objects.filter(user=user, name='', revoked=False)
+    tokens = token_model.objects.filter(revoked=False)
 
-    if token.exists():
-        return token.first()
+    try:
+        token, _created = tokens.get_or_create(user=user, name='')
+    except token_model.MultipleObjectsReturned:
+        token = tokens.filter(user=user, name='').first()
 
-    else:
-        return token_model.objects.create(user=user, name='')
+    return token
 
 
 class ApiToken(AuthToken, InvenTree.models.MetadataMixin):
@@ -82,6 +97,10 @@ class ApiToken(AuthToken, InvenTree.models.MetadataMixin):
         verbose_name_plural = _('API Tokens')
         abstract = False
 
+        indexes = [
+            models.Index(fields=['user', 'revoked'], name='apitoken_user_revoked_idx')
+        ]
+
     def __str__(self):
         """String representation uses the redacted token."""
         return self.token
@@ -90,7 +109,7 @@ class ApiToken(AuthToken, InvenTree.models.MetadataMixin):
     def generate_key(cls, prefix='inv-'):
         """Generate a new token key - with custom prefix."""
         # Suffix is the date of creation
-        suffix = '-' + str(datetime.datetime.now().date().isoformat().replace('-', ''))
+        suffix = token_key_suffix(datetime.date.today())
 
         return prefix + str(AuthToken.generate_key()) + suffix
 
@@ -166,9 +185,15 @@ class ApiToken(AuthToken, InvenTree.models.MetadataMixin):
         if self.pk is None:
             return self.key
 
-        M = len(self.key) - 20
+        # Cache the redacted value against the instance (for the current key)
+        key, redacted = getattr(self, '_redacted_token', (None, None))
+
+        if key != self.key:
+            key = self.key
+            redacted = f'{key[:8]}{"*" * (len(key) - 20)}{key[-12:]}'
+            self._redacted_token = (key, redacted)
 
-        return self.key[:8] + '*' * M + self.key[-12:]
+        return redacted
 
     @property
     @admin.display(boolean=True, description=_('Expired'))
@@ -215,8 +240,12 @@ class RuleSet(models.Model):
     RULESET_PERMISSIONS = ['view', 'add', 'change', 'delete']
 
     @staticmethod
+    @functools.cache
     def get_ruleset_models():
-        """Return a dictionary of models associated with each ruleset."""
+        """Return a dictionary of models associated with each ruleset.
+
+        The result is computed once and cached, as it does not change at runtime.
+        """
         ruleset_models = {
             'admin': [
                 'auth_group',
@@ -323,13 +352,36 @@ class RuleSet(models.Model):
         if settings.SITE_MULTI:
             ruleset_models['admin'].append('sites_site')
 
-        return ruleset_models
+        # The same (cached) object is returned to every caller, so it must be read-only
+        return MappingProxyType({
+            role: tuple(tables) for role, tables in ruleset_models.items()
+        })
+
+    @staticmethod
+    @functools.cache
+    def get_table_roles():
+        """Return a dictionary of the roles associated with each database table.
+
+        This is the inverse of get_ruleset_models(), and allows
+        the roles for a given table to be found with a single lookup.
+        """
+        table_roles = {}
+
+        for role, tables in RuleSet.get_ruleset_models().items():
+            for table in tables:
+                table_roles.setdefault(table, []).append(role)
+
+        # The same (cached) object is returned to every caller, so it must be read-only
+        return MappingProxyType({
+            table: tuple(roles) for table, roles in table_roles.items()
+        })
 
     # Database models we ignore permission sets for
     @staticmethod
+    @functools.cache
     def get_ruleset_ignore():
-        """Return a list of database tables which do not require permissions."""
-        return [
+        """Return a set of database tables which do not require permissions."""
+        return frozenset([
             # Core django models (not user configurable)
             'admin_logentry',
             'contenttypes_contenttype',
@@ -357,12 +409,24 @@ class RuleSet(models.Model):
             'django_q_task',
             'django_q_schedule',
             'django_q_success',
-        ]
+        ])
 
     RULESET_CHANGE_INHERIT = [('part', 'partparameter'), ('part', 'bomitem')]
 
+    @staticmethod
+    @functools.cache
+    def get_inherited_tables():
+        """Return a dictionary of child tables which inherit permissions from a parent role."""
+        return MappingProxyType({
+            f'{parent}_{child}': parent
+            for parent, child in RuleSet.RULESET_CHANGE_INHERIT
+        })
+
     RULE_OPTIONS = ['can_view', 'can_add', 'can_change', 'can_delete']
 
+    # Map each permission to the field which grants it
+    RULE_OPTION_MAP = dict(zip(RULESET_PERMISSIONS, RULE_OPTIONS))
+
     class Meta:
         """Metaclass defines additional model properties."""
 
@@ -406,30 +470,44 @@ class RuleSet(models.Model):
 
     @classmethod
     def check_table_permission(cls, user, table, permission):
-        """Check if the provided user has the specified permission against the table."""
+        """Check if the provided user has the specified permission against the table.
+
+        The result is stored against the user instance (which is request-scoped),
+        so repeated checks for the same table and permission are not re-evaluated.
+        """
         # Superuser knows no bounds
         if user.is_superuser:
             return True
 
+        results = getattr(user, '_table_permissions', None)
+
+        if results is None:
+            results = user._table_permissions = {}
+
+        key = (table, permission)
+
+        if key not in results:
+            results[key] = cls._check_table_permission(user, table, permission)
+
+        return results[key]
+
+    @classmethod
+    def _check_table_permission(cls, user, table, permission):
+        """Evaluate if the provided user has the specified permission against the table."""
         # If the table does *not* require permissions
         if table in cls.get_ruleset_ignore():
             return True
 
-        # Work out which roles touch the given table
-        for role in cls.RULESET_NAMES:
-            if table in cls.get_ruleset_models()[role]:
-                if check_user_role(user, role, permission):
-                    return True
+        # Check each of the roles which touch the given table
+        for role in cls.get_table_roles().get(table, []):
+            if check_user_role(user, role, permission):
+                return True
 
         # Check for children models which inherits from parent role
-        for parent, child in cls.RULESET_CHANGE_INHERIT:
-            # Get child model name
-            parent_child_string = f'{parent}_{child}'
-
-            if parent_child_string == table:
-                # Check if parent role has change permission
-                if check_user_role(user, parent, 'change'):
-                    return True
+        if parent := cls.get_inherited_tables().get(table):
+            # Check if parent role has change permission
+            if check_user_role(user, parent, 'change'):
+                return True
 
         # Print message instead of throwing an error
         name = getattr(user, 'name', user.pk)
@@ -451,9 +529,9 @@ class RuleSet(models.Model):
         if debug:
             # Makes debugging easier
             return (
-                f'{str(self.group).ljust(15)}: {self.name.title().ljust(15)} | '
-                f'v: {str(self.can_view).ljust(5)} | a: {str(self.can_add).ljust(5)} | '
-                f'c: {str(self.can_change).ljust(5)} | d: {str(self.can_delete).ljust(5)}'
+                f'{self.group!s:<15}: {self.name.title():<15} | '
+                f'v: {self.can_view!s:<5} | a: {self.can_add!s:<5} | '
+                f'c: {self.can_change!s:<5} | d: {self.can_delete!s:<5}'
             )
         return self.name
 
@@ -477,11 +555,15 @@ class RuleSet(models.Model):
 
     def get_models(self):
         """Return the database tables / models that this ruleset covers."""
-        return self.get_ruleset_models().get(self.name, [])
+        return self.get_ruleset_models().get(self.name, ())
 
 
+@functools.cache
 def split_model(model):
-    """Get modelname and app from modelstring."""
+    """Get modelname and app from modelstring.
+
+    The set of model strings is small and fixed, so the result is cached.
+    """
     *app, model = model.split('_')
 
     # handle models that have
@@ -493,17 +575,6 @@ def split_model(model):
     return model, app
 
 
-def split_permission(app, perm):
-    """Split permission string into permission and model."""
-    permission_name, *model = perm.split('_')
-    # handle models that have underscores
-    if len(model) > 1:  # pragma: no cover
-        app += '_' + '_'.join(model[:-1])
-        perm = permission_name + '_' + model[-1:][0]
-    model = model[-1:][0]
-    return perm, model
-
-
 def update_group_roles(group, debug=False):
     """Iterates through all of the RuleSets associated with the group, and ensures that the correct permissions are either applied or removed from the group.
 
@@ -517,15 +588,14 @@ def update_group_roles(group, debug=False):
     if not canAppAccessDatabase(allow_test=True):
         return  # pragma: no cover
 
-    # List of permissions already associated with this group
-    group_permissions = set()
-
-    # Iterate through each permission already assigned to this group,
-    # and create a simplified permission key string
-    for p in group.permissions.all().prefetch_related('content_type'):
-        (permission, app, model) = p.natural_key()
-        permission_string = f'{app}.{permission}'
-        group_permissions.add(permission_string)
+    # Construct a simplified permission key string (e.g. 'part.view_part')
+    # for each permission already assigned to this group
+    group_permissions = {
+        f'{app}.{codename}'
+        for codename, app in group.permissions.values_list(
+            'codename', 'content_type__app_label'
+        )
+    }
 
     # List of permissions which must be added to the group
     permissions_to_add = set()
@@ -563,17 +633,27 @@ def update_group_roles(group, debug=False):
         r.name: r for r in RuleSet.objects.filter(group=group).prefetch_related('group')
     }
 
+    # Create any missing RuleSet objects (with default values) in a single query
+    missing = [name for name in RuleSet.RULESET_NAMES if name not in rulesets]
+
+    if missing:
+        RuleSet.objects.bulk_create(
+            [RuleSet(group=group, name=name) for name in missing], ignore_conflicts=True
+        )
+
+        rulesets = {r.name: r for r in RuleSet.objects.filter(group=group)}
+
+        # bulk_create does not call RuleSet.save() (which saves the group),
+        # so the cached roles for the group members must be cleared here
+        for user in get_user_model().objects.filter(groups=group):
+            clear_user_role_cache(user)
+
     # Get all the rulesets associated with this group
-    for r in RuleSet.RULESET_CHOICES:
-        rulename = r[0]
+    for rulename in RuleSet.RULESET_NAMES:
+        ruleset = rulesets.get(rulename)
 
-        if rulename in rulesets:
-            ruleset = rulesets[rulename]
-        else:
-            try:
-                ruleset = RuleSet.objects.get(group=group, name=rulename)
-            except RuleSet.DoesNotExist:
-                ruleset = RuleSet.objects.create(group=group, name=rulename)
+        if ruleset is None:  # pragma: no cover
+            continue
 
         # Which database tables does this RuleSet touch?
         models = ruleset.get_models()
@@ -586,64 +666,42 @@ def update_group_roles(group, debug=False):
             add_model(model, 'change', ruleset.can_change)
             add_model(model, 'delete', ruleset.can_delete)
 
-    def get_permission_object(permission_string):
-        """Find the permission object in the database, from the simplified permission string.
+    def get_permission_objects(permission_strings):
+        """Find the permission objects in the database, from the simplified permission strings.
+
+        All permission objects are fetched with a single query.
 
         Args:
-            permission_string: a simplified permission_string e.g. 'part.view_partcategory'
+            permission_strings: a list of simplified permission strings e.g. 'part.view_partcategory'
 
-        Returns the permission object in the database associated with the permission string
+        Returns a dict mapping each permission string to the associated permission object
         """
-        (app, perm) = permission_string.split('.')
-
-        perm, model = split_permission(app, perm)
+        if not permission_strings:
+            return {}
 
-        try:
-            content_type = ContentType.objects.get(app_label=app, model=model)
-            permission = Permission.objects.get(
-                content_type=content_type, codename=perm
-            )
-        except ContentType.DoesNotExist:  # pragma: no cover
-            # logger.warning(
-            #     "Error: Could not find permission matching '%s'", permission_string
-            # )
-            permission = None
+        app_labels = set()
+        codenames = set()
 
-        return permission
+        for permission_string in permission_strings:
+            (app, perm) = permission_string.split('.')
+            app_labels.add(app)
+            codenames.add(perm)
 
-    # Add any required permissions to the group
-    for perm in permissions_to_add:
-        # Ignore if permission is already in the group
-        if perm in group_permissions:
-            continue
+        permissions = Permission.objects.filter(
+            content_type__app_label__in=app_labels, codename__in=codenames
+        ).select_related('content_type')
 
-        permission = get_permission_object(perm)
+        return {f'{p.content_type.app_label}.{p.codename}': p for p in permissions}
 
-        if permission:
-            group.permissions.add(permission)
+    # Permissions which are not already in the group, and must be added
+    add_permissions = [p for p in permissions_to_add if p not in group_permissions]
 
-        if debug:  # pragma: no cover
-            logger.debug('Adding permission %s to group %s', perm, group.name)
-
-    # Remove any extra permissions from the group
-    for perm in permissions_to_delete:
-        # Ignore if the permission is not already assigned
-        if perm not in group_permissions:
-            continue
-
-        permission = get_permission_object(perm)
-
-        if permission:
-            group.permissions.remove(permission)
-
-        if debug:  # pragma: no cover
-            logger.debug('Removing permission %s from group %s', perm, group.name)
+    # Permissions which are already in the group, and must be removed
+    remove_permissions = [p for p in permissions_to_delete if p in group_permissions]
 
     # Enable all action permissions for certain children models
     # if parent model has 'change' permission
     for parent, child in RuleSet.RULESET_CHANGE_INHERIT:
-        parent_child_string = f'{parent}_{child}'
-
         # Check each type of permission
         for action in ['view', 'change', 'add', 'delete']:
             parent_perm = f'{parent}.{action}_{parent}'
@@ -653,15 +711,30 @@ def update_group_roles(group, debug=False):
 
                 # Check if child permission not already in group
                 if child_perm not in group_permissions:
-                    # Create permission object
-                    add_model(parent_child_string, action, ruleset.can_delete)
-                    # Add to group
-                    permission = get_permission_object(child_perm)
-                    if permission:
-                        group.permissions.add(permission)
-                        logger.debug(
-                            'Adding permission %s to group %s', child_perm, group.name
-                        )
+                    add_permissions.append(child_perm)
+
+    permission_objects = get_permission_objects(add_permissions + remove_permissions)
+
+    # Add any required permissions to the group
+    to_add = [permission_objects[p] for p in add_permissions if p in permission_objects]
+
+    if to_add:
+        group.permissions.add(*to_add)
+
+    # Remove any extra permissions from the group
+    to_remove = [
+        permission_objects[p] for p in remove_permissions if p in permission_objects
+    ]
+
+    if to_remove:
+        group.permissions.remove(*to_remove)
+
+    if debug:  # pragma: no cover
+        for perm in add_permissions:
+            logger.debug('Adding permission %s to group %s', perm, group.name)
+
+        for perm in remove_permissions:
+            logger.debug('Removing permission %s from group %s', perm, group.name)
 
 
 def clear_user_role_cache(user):
@@ -677,16 +750,66 @@ def clear_user_role_cache(user):
             key = f'role_{user}_{role}_{perm}'
             cache.delete(key)
 
+    # Remove any role / owner information stored against the user instance
+    for attr in ['_role_matrix', '_table_permissions', '_owner']:
+        if hasattr(user, attr):
+            delattr(user, attr)
+
+
+def get_user_role_matrix(user):
+    """Return the role permissions available to a user.
+
+    All rulesets associated with the user's groups are fetched with a single query.
+    The result is stored against the user instance (which is request-scoped),
+    so subsequent role checks for the same user do not hit the database.
+
+    Returns:
+        A dict of {(role, permission): True} entries for each allowed role:permission combination
+    """
+    matrix = getattr(user, '_role_matrix', None)
+
+    if matrix is None:
+        matrix = {}
+
+        # Join through the user's group memberships (rather than a subquery)
+        rulesets = RuleSet.objects.filter(group__user=user).values(
+            'name', *RuleSet.RULE_OPTIONS
+        )
+
+        for rule in rulesets:
+            for perm, option in RuleSet.RULE_OPTION_MAP.items():
+                if rule[option]:
+                    matrix[(rule['name'], perm)] = True
+
+        user._role_matrix = matrix
+
+    return matrix
+
 
 def check_user_role(user, role, permission):
     """Check if a user has a particular role:permission combination.
 
     If the user is a superuser, this will return True
+    If the user is not authenticated, this will return False
     """
+    # Anonymous users have no roles - no need to consult the cache
+    if user is None or user.is_anonymous:
+        return False
+
     if user.is_superuser:
         return True
 
-    # First, check the cache
+    # Unknown permission types are never granted
+    if permission not in RuleSet.RULE_OPTION_MAP:
+        return False
+
+    # Role information has already been loaded for this user instance
+    matrix = getattr(user, '_role_matrix', None)
+
+    if matrix is not None:
+        return matrix.get((role, permission), False)
+
+    # Next, check the cache
     key = f'role_{user}_{role}_{permission}'
 
     try:
@@ -697,27 +820,7 @@ def check_user_role(user, role, permission):
     if result is not None:
         return result
 
-    # Default for no match
-    result = False
-
-    for group in user.groups.all():
-        for rule in group.rule_sets.all():
-            if rule.name == role:
-                if permission == 'add' and rule.can_add:
-                    result = True
-                    break
-
-                if permission == 'change' and rule.can_change:
-                    result = True
-                    break
-
-                if permission == 'view' and rule.can_view:
-                    result = True
-                    break
-
-                if permission == 'delete' and rule.can_delete:
-                    result = True
-                    break
+    result = get_user_role_matrix(user).get((role, permission), False)
 
     # Save result to cache
     try:
@@ -754,24 +857,20 @@ class Owner(models.Model):
         - An exact match for the user
         - Any groups that the user is a part of
         """
-        user_type = ContentType.objects.get(app_label='auth', model='user')
-        group_type = ContentType.objects.get(app_label='auth', model='group')
-
-        owners = []
-
-        try:
-            owners.append(cls.objects.get(owner_id=user.pk, owner_type=user_type))
-        except Exception:  # pragma: no cover
-            pass
-
-        for group in user.groups.all():
-            try:
-                owner = cls.objects.get(owner_id=group.pk, owner_type=group_type)
-                owners.append(owner)
-            except Exception:  # pragma: no cover
-                pass
+        user_type = ContentType.objects.get_for_model(get_user_model())
+        group_type = ContentType.objects.get_for_model(Group)
+
+        # Fetch all matching owners with a single query
+        owners = cls.objects.filter(
+            Q(owner_type=user_type, owner_id=user.pk)
+            | Q(
+                owner_type=group_type,
+                owner_id__in=user.groups.values_list('pk', flat=True),
+            )
+        )
 
-        return owners
+        # Ensure that the user owner is listed first
+        return sorted(owners, key=lambda owner: owner.owner_type_id != user_type.pk)
 
     @staticmethod
     def get_api_url():  # pragma: no cover
@@ -788,22 +887,33 @@ class Owner(models.Model):
 
     def __str__(self):
         """Defines the owner string representation."""
-        if self.owner_type.name == 'user' and get_global_setting(
-            'DISPLAY_FULL_NAMES', cache=True
-        ):
-            display_name = self.owner.get_full_name()
+        owner_type = self.owner_type.name
+
+        if owner_type == 'user':
+            display_name = self._user_display_name()
         else:
             display_name = str(self.owner)
-        return f'{display_name} ({self.owner_type.name})'
+
+        return f'{display_name} ({owner_type})'
 
     def name(self):
         """Return the 'name' of this owner."""
-        if self.owner_type.name == 'user' and get_global_setting(
-            'DISPLAY_FULL_NAMES', cache=True
-        ):
-            return self.owner.get_full_name() or str(self.owner)
+        if self.owner_type.name == 'user':
+            return self._user_display_name() or self.owner.get_username()
         return str(self.owner)
 
+    def _user_display_name(self):
+        """Return the display name for a "user-type" owner.
+
+        The DISPLAY_FULL_NAMES setting is only looked up once here,
+        rather than again via the overridden User.__str__ method.
+        """
+        user = self.owner
+
+        if get_global_setting('DISPLAY_FULL_NAMES', cache=True):
+            return user.get_full_name()
+        return user.get_username()
+
     def label(self):
         """Return the 'type' label of this owner i.e. 'user' or 'group'."""
         return str(self.owner_type.name)
@@ -823,70 +933,107 @@ class Owner(models.Model):
 
         return existing_owner
 
+    @classmethod
+    def bulk_create_for(cls, instances):
+        """Create owner entries for multiple group or user instances.
+
+        Instances which already have a matching owner are ignored.
+        Note: Owners are created in bulk, so no post_save signal is sent for them.
+        """
+        owners = [
+            cls(owner_type=ContentType.objects.get_for_model(obj), owner_id=obj.pk)
+            for obj in instances
+        ]
+
+        return cls.objects.bulk_create(owners, ignore_conflicts=True, batch_size=1000)
+
     @classmethod
     def get_owner(cls, user_or_group):
         """Get owner instance for a group or user."""
         user_model = get_user_model()
         owner = None
-        content_type_id = 0
-        content_type_id_list = [
-            ContentType.objects.get_for_model(Group).id,
-            ContentType.objects.get_for_model(user_model).id,
-        ]
 
         # If instance type is obvious: set content type
+        # Note: get_for_model() lookups are cached by the ContentType manager
         if isinstance(user_or_group, Group):
-            content_type_id = content_type_id_list[0]
-        elif isinstance(user_or_group, get_user_model()):
-            content_type_id = content_type_id_list[1]
+            content_type = ContentType.objects.get_for_model(Group)
+        elif isinstance(user_or_group, user_model):
+            content_type = ContentType.objects.get_for_model(user_model)
+        else:
+            content_type = None
 
-        if content_type_id:
+        if content_type:
             try:
                 owner = Owner.objects.get(
-                    owner_id=user_or_group.id, owner_type=content_type_id
+                    owner_id=user_or_group.id, owner_type=content_type
                 )
             except Owner.DoesNotExist:
                 pass
 
         return owner
 
+    def _is_owner_type(self, model):
+        """Test if this owner refers to the provided model, without fetching the owner instance."""
+        return self.owner_type_id == ContentType.objects.get_for_model(model).id
+
+    def _related_user_owners_q(self):
+        """Return a Q object matching the "user-type" owners for members of this (group-type) owner."""
+        user_model = get_user_model()
+
+        # Semi-join against the group membership table (the user table is not required)
+        members = user_model.groups.through.objects.filter(
+            group_id=self.owner_id, user_id=OuterRef('owner_id')
+        )
+
+        return Q(
+            Exists(members), owner_type=ContentType.objects.get_for_model(user_model).id
+        )
+
+    def _related_owners_q(self, include_group=False):
+        """Return a Q object matching the owners "related" to this (group-type) owner."""
+        if include_group:
+            # Include this "group-type" owner in the query
+            return self._related_user_owners_q() | Q(pk=self.pk)
+
+        return self._related_user_owners_q()
+
     def get_related_owners(self, include_group=False):
         """Get all owners "related" to an owner.
 
         This method is useful to retrieve all "user-type" owners linked to a "group-type" owner
         """
-        user_model = get_user_model()
         related_owners = None
 
-        if type(self.owner) is Group:
-            users = user_model.objects.filter(groups__name=self.owner.name)
-
-            if include_group:
-                # Include "group-type" owner in the query
-                query = Q(
-                    owner_id__in=users,
-                    owner_type=ContentType.objects.get_for_model(user_model).id,
-                ) | Q(
-                    owner_id=self.owner.id,
-                    owner_type=ContentType.objects.get_for_model(Group).id,
-                )
-            else:
-                query = Q(
-                    owner_id__in=users,
-                    owner_type=ContentType.objects.get_for_model(user_model).id,
-                )
-
-            related_owners = Owner.objects.filter(query)
-
-        elif type(self.owner) is user_model:
+        # "User-type" owners are the common case, and do not require a query
+        if self._is_owner_type(get_user_model()):
             related_owners = [self]
 
+        elif self._is_owner_type(Group):
+            related_owners = Owner.objects.filter(
+                self._related_owners_q(include_group=include_group)
+            )
+
         return related_owners
 
     def is_user_allowed(self, user, include_group: bool = False):
         """Check if user is allowed to access something owned by this owner."""
-        user_owner = Owner.get_owner(user)
-        return user_owner in self.get_related_owners(include_group=include_group)
+        # The owner is stored against the user instance (which is request-scoped),
+        # so that repeated checks for the same user do not look it up again
+        if not hasattr(user, '_owner'):
+            user._owner = Owner.get_owner(user)
+
+        user_owner = user._owner
+
+        if user_owner is None:
+            return False
+
+        if self._is_owner_type(Group):
+            # Check for a match in the database, rather than fetching all related owners
+            return Owner.objects.filter(
+                self._related_owners_q(include_group=include_group), pk=user_owner.pk
+            ).exists()
+
+        return user_owner == self
 
 
 @receiver(post_save, sender=Group, dispatch_uid='create_owner')
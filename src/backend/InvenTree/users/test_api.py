@@ -6,6 +6,7 @@ from django.contrib.auth.models import Group, User
 from django.urls import reverse
 
 from InvenTree.unit_test import InvenTreeAPITestCase
+from users.authentication import ApiTokenAuthentication
 from users.models import ApiToken
 
 
@@ -199,6 +200,27 @@ class UserTokenTests(InvenTreeAPITestCase):
 
         self.client.get(me, expected_code=200)
 
+    def test_token_auth_queries(self):
+        """Test that token authentication only loads the required token fields."""
+        token = ApiToken.objects.create(user=self.user, name='query-test')
+        auth = ApiTokenAuthentication()
+
+        # First use of the token also updates the 'last_seen' date
+        with self.assertNumQueries(2):
+            user, auth_token = auth.authenticate_credentials(token.key)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(auth_token.pk, token.pk)
+        self.assertIn('metadata', auth_token.get_deferred_fields())
+        self.assertIn('name', auth_token.get_deferred_fields())
+
+        token.refresh_from_db()
+        self.assertEqual(token.last_seen, datetime.date.today())
+
+        # Subsequent use requires only the token lookup
+        with self.assertNumQueries(1):
+            auth.authenticate_credentials(token.key)
+
     def test_buildin_token(self):
         """Test the built-in token authentication."""
         response = self.post(
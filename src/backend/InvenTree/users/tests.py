@@ -1,12 +1,24 @@
 """Unit tests for the 'users' app."""
 
+import datetime
+
 from django.apps import apps
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.test import TestCase, tag
 from django.urls import reverse
 
 from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase
-from users.models import ApiToken, Owner, RuleSet
+from users.models import (
+    ApiToken,
+    Owner,
+    RuleSet,
+    check_user_role,
+    clear_user_role_cache,
+    default_create_token,
+    update_group_roles,
+)
 
 
 class RuleSetModelTest(TestCase):
@@ -47,6 +59,28 @@ class RuleSetModelTest(TestCase):
         self.assertEqual(len(extra), 0)
         self.assertEqual(len(empty), 0)
 
+    def test_ruleset_models_readonly(self):
+        """Test that the cached ruleset models cannot be modified by callers."""
+        ruleset_models = RuleSet.get_ruleset_models()
+
+        with self.assertRaises(TypeError):
+            ruleset_models['admin'] = ()
+
+        for tables in ruleset_models.values():
+            self.assertIsInstance(tables, tuple)
+
+    def test_table_roles(self):
+        """Test that the table -> role mapping matches the defined rulesets."""
+        table_roles = RuleSet.get_table_roles()
+
+        for role, tables in RuleSet.get_ruleset_models().items():
+            for table in tables:
+                self.assertIn(role, table_roles[table])
+
+        # Tables can be covered by multiple roles
+        self.assertEqual(table_roles['part_part'], ('part', 'build'))
+        self.assertNotIn('users_owner', table_roles)
+
     def test_model_names(self):
         """Test that each model defined in the rulesets is valid, based on the database schema!"""
         available_models = apps.get_models()
@@ -156,6 +190,68 @@ class RuleSetModelTest(TestCase):
         self.assertEqual(group.permissions.count(), 0)
 
 
+class UserRoleTest(InvenTreeTestCase):
+    """Tests for checking the roles assigned to a user."""
+
+    roles = ['part.view', 'stock.change']
+
+    def test_role_matrix(self):
+        """Test that role checks for a user are resolved with a single query."""
+        user = get_user_model().objects.get(pk=self.user.pk)
+        clear_user_role_cache(user)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(check_user_role(user, 'part', 'view'))
+            self.assertFalse(check_user_role(user, 'part', 'delete'))
+            self.assertTrue(check_user_role(user, 'stock', 'change'))
+            self.assertFalse(check_user_role(user, 'build', 'add'))
+
+        # Clearing the cache also clears the information stored against the user
+        clear_user_role_cache(user)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(check_user_role(user, 'stock', 'view'))
+
+        # Unknown permission types are rejected without a query
+        clear_user_role_cache(user)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(check_user_role(user, 'part', 'approve'))
+
+    def test_table_permission(self):
+        """Test that table permission checks are cached against the user."""
+        user = get_user_model().objects.get(pk=self.user.pk)
+        clear_user_role_cache(user)
+
+        check = RuleSet.check_table_permission
+
+        self.assertTrue(check(user, 'part_part', 'view'))
+        self.assertFalse(check(user, 'part_part', 'delete'))
+        self.assertTrue(check(user, 'stock_stockitem', 'change'))
+
+        # Tables which do not require permissions
+        self.assertTrue(check(user, 'users_owner', 'delete'))
+
+        # Repeated checks do not hit the database
+        with self.assertNumQueries(0):
+            self.assertTrue(check(user, 'part_part', 'view'))
+            self.assertFalse(check(user, 'part_part', 'delete'))
+
+    def test_missing_rulesets(self):
+        """Test that creating missing rulesets clears the cached roles for group members."""
+        user = get_user_model().objects.get(pk=self.user.pk)
+
+        key = f'role_{user}_build_view'
+        cache.set(key, False)
+
+        RuleSet.objects.filter(group=self.group, name='build').delete()
+        update_group_roles(self.group)
+
+        # New rulesets are created with the 'view' permission
+        self.assertIsNone(cache.get(key))
+        self.assertTrue(check_user_role(user, 'build', 'view'))
+
+
 class OwnerModelTest(InvenTreeTestCase):
     """Some simplistic tests to ensure the Owner model is setup correctly."""
 
@@ -194,10 +290,50 @@ class OwnerModelTest(InvenTreeTestCase):
         related_owners = user_as_owner.get_related_owners()
         self.assertEqual(related_owners, [user_as_owner])
 
+        # The owner type is resolved without fetching the user instance
+        owner = Owner.objects.get(pk=user_as_owner.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(owner.get_related_owners(), [owner])
+
         # Check owner matching
         owners = Owner.get_owners_matching_user(self.user)
         self.assertEqual(owners, [user_as_owner, group_as_owner])
 
+        # Check user access (owner is cached against the user instance)
+        self.assertTrue(group_as_owner.is_user_allowed(self.user))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(user_as_owner.is_user_allowed(self.user))
+
+        # The stored owner is removed along with the other user role information
+        clear_user_role_cache(self.user)
+        self.assertFalse(hasattr(self.user, '_owner'))
+
+        # Users outside of the group are not allowed
+        other_user = get_user_model().objects.create_user(username='other_user')
+        self.assertFalse(group_as_owner.is_user_allowed(other_user))
+        self.assertFalse(user_as_owner.is_user_allowed(other_user))
+
+        # Create missing owners in bulk
+        Owner.objects.filter(pk__in=[user_as_owner.pk, group_as_owner.pk]).delete()
+        Owner.bulk_create_for([self.user, self.group])
+
+        self.assertIsNotNone(Owner.get_owner(self.user))
+        self.assertIsNotNone(Owner.get_owner(self.group))
+
+        # Existing owners are ignored
+        n = Owner.objects.count()
+        Owner.bulk_create_for([self.user, self.group])
+        self.assertEqual(Owner.objects.count(), n)
+
+        # Missing owners are created at startup, even if an owner without an id exists
+        Owner.objects.create(owner_type=user_as_owner.owner_type, owner_id=None)
+        Owner.objects.filter(pk=Owner.get_owner(self.user).pk).delete()
+
+        apps.get_app_config('users').update_owners()
+        self.assertIsNotNone(Owner.get_owner(self.user))
+
         # Delete user and verify owner was deleted too
         self.user.delete()
         user_as_owner = Owner.get_owner(self.user)
@@ -264,6 +400,15 @@ class OwnerModelTest(InvenTreeTestCase):
         response = self.do_request(reverse('api-token'), {})
         self.assertEqual(response['token'], token.first().key)
 
+        # Token key is suffixed with the creation date
+        suffix = '-' + datetime.date.today().strftime('%Y%m%d')
+        self.assertTrue(token.first().key.endswith(suffix))
+
+        # The default token is reused, rather than a new token being created
+        default = default_create_token(ApiToken, self.user, None)
+        self.assertEqual(default_create_token(ApiToken, self.user, None), default)
+        self.assertEqual(token.filter(name='').count(), 1)
+
         # test user is associated with token
         response = self.do_request(
             reverse('api-user-me'), {'name': 'another-token'}, 200